@@ -13,3 +13,22 @@ REQUIRED_FILES = [
 
 # Visualization settings
 VISUALIZATION_OUTPUT = 'report/elasticsearch_cluster_visualization.html'
+
+# Hot-spot detection settings
+HOTSPOT_ZSCORE_THRESHOLD = 3.5  # Per-tier modified z-score (median/MAD) at or above which a metric is flagged
+HOTSPOT_MIN_TIER_SIZE = 3  # Tiers with fewer nodes have no majority to compare against and are not scored
+# Smallest deviation above the tier median that can be flagged, in each metric's own unit
+HOTSPOT_MIN_DEVIATION = {
+    "cpu": 10,  # percentage points
+    "heap": 10,
+    "disk": 10,
+    "fieldDataCache": 64 * 1024 * 1024,  # bytes
+    "queryCache": 64 * 1024 * 1024,
+    "segmentMemory": 64 * 1024 * 1024,
+    "shardCount": 5
+}
+HOTSPOT_MIN_RELATIVE_DEVIATION = 0.25  # The deviation must also be at least this fraction of the tier median
+# Chance of a rolling pattern's busiest node exceeding its expected maximum under random shard
+# placement, shared across all nodes of the tier. The excess must also clear the shardCount floors above.
+HOTSPOT_PATTERN_SIGNIFICANCE = 0.01
+HOTSPOT_REPORT_LIMIT = 10  # Number of ranked hot spots listed in the reports
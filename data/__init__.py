@@ -1,2 +1,3 @@
 from .loader import DataLoader
 from .processor import DataProcessor
+from .hotspots import HotspotAnalyzer
@@ -0,0 +1,209 @@
+import logging
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+from config import (HOTSPOT_ZSCORE_THRESHOLD, HOTSPOT_MIN_TIER_SIZE, HOTSPOT_MIN_DEVIATION,
+                    HOTSPOT_MIN_RELATIVE_DEVIATION, HOTSPOT_PATTERN_SIGNIFICANCE)
+from utils.helpers import calculate_disk_usage, calculate_memory_usage, determine_node_type, extract_rolling_pattern
+
+logger = logging.getLogger(__name__)
+
+# Metrics compared across the nodes of a tier, with their display labels
+NODE_METRICS = {
+    "cpu": "CPU Usage (%)",
+    "heap": "Heap Usage (%)",
+    "disk": "Disk Usage (%)",
+    "fieldDataCache": "Field Data Cache",
+    "queryCache": "Query Cache",
+    "segmentMemory": "Segment Memory",
+    "shardCount": "Shard Count"
+}
+
+class HotspotAnalyzer:
+    """Flags nodes and rolling patterns that stand out from the rest of their tier.
+
+    Every node metric gets a modified z-score (deviation from the tier median
+    over the scaled median absolute deviation) and a percentile within its tier
+    (hot/warm/cold/frozen). The median and MAD are not dragged along by the
+    outlier itself, so a single hot node is caught even in a three-node tier.
+    A metric is only flagged when its deviation also clears a per-metric floor,
+    so near-identical tiers do not turn 20% vs 21% CPU into a hot spot. A
+    node's score is its highest modified z-score. Tiers smaller than
+    HOTSPOT_MIN_TIER_SIZE are left unscored rather than reported as healthy.
+
+    A rolling pattern is scored on its busiest node against the largest count
+    random placement would put on any node of the tier. Its score is the excess
+    over that maximum divided by the shard-count floor, so 1.0 or more is a hot
+    spot. Pattern tiers are gated by the same minimum tier size. All statistics
+    are grouped pandas operations, so the cost grows linearly with nodes and
+    shards.
+    """
+
+    def __init__(self, raw_data, zscore_threshold=HOTSPOT_ZSCORE_THRESHOLD,
+                 pattern_significance=HOTSPOT_PATTERN_SIGNIFICANCE):
+        self.raw_data = raw_data
+        self.zscore_threshold = zscore_threshold
+        self.pattern_significance = pattern_significance
+
+    def analyze(self):
+        nodes = self._build_node_table()
+        if nodes.empty:
+            logger.warning("No nodes found, skipping hot-spot analysis.")
+            return {"nodes": {}, "rollingPatterns": {}}
+        shards = self._build_shard_table(nodes)
+
+        nodes["shardCount"] = shards.groupby("node").size().reindex(nodes.index, fill_value=0)
+        nodes = self._score_nodes(nodes)
+        patterns = self._score_patterns(nodes, shards)
+
+        logger.info(f"Hot-spot analysis found {int(nodes['isHotspot'].sum())} node(s) and "
+                    f"{int(patterns['isHotspot'].sum()) if not patterns.empty else 0} rolling pattern(s).")
+        return {
+            "nodes": self._node_results(nodes),
+            "rollingPatterns": self._pattern_results(patterns)
+        }
+
+    def _build_node_table(self):
+        nodes_stats = self.raw_data['nodes_stats.json'].get('nodes', {})
+        nodes_info = self.raw_data['nodes.json'].get('nodes', {})
+
+        rows = []
+        for node_id, node_info in nodes_info.items():
+            node_stats = nodes_stats.get(node_id, {})
+            memory_usage = calculate_memory_usage(node_stats)
+            heap_max = node_stats.get('jvm', {}).get('mem', {}).get('heap_max_in_bytes', 0)
+            rows.append({
+                "nodeId": node_id,
+                "name": node_info.get('name', 'Unknown'),
+                "tier": determine_node_type(node_info),
+                "cpu": node_stats.get('os', {}).get('cpu', {}).get('percent', 0),
+                "heap": memory_usage['jvmHeap'] / heap_max * 100 if heap_max else 0,
+                "disk": calculate_disk_usage(node_stats),
+                "fieldDataCache": memory_usage['fieldDataCache'],
+                "queryCache": memory_usage['queryCache'],
+                "segmentMemory": memory_usage['segmentMemory']
+            })
+
+        columns = ["nodeId", "name", "tier"] + [m for m in NODE_METRICS if m != "shardCount"]
+        return pd.DataFrame(rows, columns=columns).set_index("nodeId")
+
+    def _build_shard_table(self, nodes):
+        indices_stats = self.raw_data['indices_stats.json'].get('indices', {})
+
+        rows = []
+        for index_name, index_stats in indices_stats.items():
+            pattern = extract_rolling_pattern(index_name)
+            for shard_data in index_stats.get('shards', {}).values():
+                copies = shard_data if isinstance(shard_data, list) else [shard_data]
+                for shard in copies:
+                    if isinstance(shard, dict):
+                        rows.append((index_name, pattern, shard.get('routing', {}).get('node')))
+
+        shards = pd.DataFrame(rows, columns=["index", "pattern", "node"])
+        # Unassigned shards and shards on nodes we have no stats for cannot be placed in a tier
+        return shards[shards["node"].isin(nodes.index)]
+
+    def _score_nodes(self, nodes):
+        metrics = list(NODE_METRICS)
+        values = nodes[metrics].astype(float)
+        tiers = nodes["tier"]
+        median = values.groupby(tiers).transform("median")
+        deviation = values - median
+        mad = deviation.abs().groupby(tiers).transform("median")
+
+        # Dividing by at least floor / threshold means a metric reaches the threshold
+        # only when its deviation clears both the MAD test and the minimum deviation.
+        # It also keeps the score finite when most of the tier shares one value (MAD 0).
+        floor = (HOTSPOT_MIN_RELATIVE_DEVIATION * median.abs()).clip(lower=pd.Series(HOTSPOT_MIN_DEVIATION), axis=1)
+        scale = (1.4826 * mad).clip(lower=floor / self.zscore_threshold)
+        zscores = deviation / scale
+        percentiles = values.groupby(tiers).rank(pct=True, method="max")
+
+        nodes = nodes.join(zscores.add_suffix("_z")).join(percentiles.add_suffix("_pct"))
+        nodes["scored"] = tiers.map(tiers.value_counts()) >= HOTSPOT_MIN_TIER_SIZE
+        nodes["score"] = zscores.max(axis=1).clip(lower=0).where(nodes["scored"])
+        nodes["isHotspot"] = nodes["score"] >= self.zscore_threshold
+        nodes = nodes.sort_values("score", ascending=False, kind="stable", na_position="last")
+        nodes["rank"] = np.arange(1, len(nodes) + 1)
+        return nodes
+
+    def _score_patterns(self, nodes, shards):
+        shards = shards.dropna(subset=["pattern"])
+        if shards.empty:
+            return pd.DataFrame(columns=["isHotspot"])
+
+        per_node = shards.groupby(["pattern", "node"]).size().rename("shards").reset_index()
+        per_node["tier"] = per_node["node"].map(nodes["tier"])
+        per_node["hotspotShards"] = per_node["shards"].where(per_node["node"].map(nodes["isHotspot"]), 0)
+
+        per_node = per_node.sort_values("shards", ascending=False, kind="stable")
+        patterns = per_node.groupby(["pattern", "tier"]).agg(
+            shardCount=("shards", "sum"),
+            nodeCount=("node", "size"),
+            maxNode=("node", "first"),
+            maxNodeShards=("shards", "first"),
+            hotspotShards=("hotspotShards", "sum")
+        ).reset_index()
+
+        # The busiest of n nodes naturally holds more than the average, so compare it with
+        # the upper Poisson quantile at significance / n (a Bonferroni correction over the
+        # tier), using the Cornish-Fisher expansion of the quantile. A node can never hold
+        # more than the pattern's own shards.
+        tier_size = patterns["tier"].map(nodes.groupby("tier").size())
+        mean = patterns["shardCount"] / tier_size
+        z = tier_size.map(lambda n: NormalDist().inv_cdf(1 - self.pattern_significance / n))
+        expected = np.ceil(mean + z * np.sqrt(mean) + (z ** 2 - 1) / 6).clip(upper=patterns["shardCount"])
+        floor = (HOTSPOT_MIN_RELATIVE_DEVIATION * expected).clip(lower=HOTSPOT_MIN_DEVIATION["shardCount"])
+
+        patterns["expectedShards"] = expected
+        patterns["scored"] = tier_size >= HOTSPOT_MIN_TIER_SIZE
+        patterns["score"] = ((patterns["maxNodeShards"] - expected) / floor).clip(lower=0).where(patterns["scored"])
+        patterns["isHotspot"] = patterns["score"] >= 1
+        patterns["maxNode"] = patterns["maxNode"].map(nodes["name"])
+
+        # A pattern spread over several tiers is reported on its worst scored tier
+        patterns = patterns.sort_values("score", ascending=False, kind="stable", na_position="last")
+        patterns = patterns.drop_duplicates("pattern")
+        patterns["rank"] = np.arange(1, len(patterns) + 1)
+        return patterns.set_index("pattern")
+
+    def _node_results(self, nodes):
+        results = {}
+        for node_id, row in nodes.iterrows():
+            scored = bool(row["scored"])
+            results[node_id] = {
+                "name": row["name"],
+                "tier": row["tier"],
+                "scored": scored,
+                "rank": int(row["rank"]) if scored else None,
+                "score": round(float(row["score"]), 2) if scored else None,
+                "isHotspot": bool(row["isHotspot"]),
+                "hotMetrics": [m for m in NODE_METRICS if scored and row[f"{m}_z"] >= self.zscore_threshold],
+                "metrics": {
+                    m: {
+                        "value": round(float(row[m]), 2),
+                        "zscore": round(float(row[f"{m}_z"]), 2),
+                        "percentile": round(float(row[f"{m}_pct"]) * 100, 1)
+                    } for m in NODE_METRICS
+                }
+            }
+        return results
+
+    def _pattern_results(self, patterns):
+        results = {}
+        for pattern, row in patterns.iterrows():
+            scored = bool(row["scored"])
+            results[pattern] = {
+                "tier": row["tier"],
+                "scored": scored,
+                "rank": int(row["rank"]) if scored else None,
+                "score": round(float(row["score"]), 2) if scored else None,
+                "isHotspot": bool(row["isHotspot"]),
+                "shardCount": int(row["shardCount"]),
+                "nodeCount": int(row["nodeCount"]),
+                "maxNode": row["maxNode"],
+                "maxNodeShards": int(row["maxNodeShards"]),
+                "expectedShards": int(row["expectedShards"]),
+                "hotspotShards": int(row["hotspotShards"])
+            }
+        return results
@@ -1,5 +1,6 @@
 import logging
-from utils.helpers import calculate_disk_usage, determine_node_type
+from utils.helpers import calculate_disk_usage, calculate_memory_usage, determine_node_type, extract_rolling_pattern
+from data.hotspots import HotspotAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -9,17 +10,20 @@ class DataProcessor:
         self.cluster_data = {"name": "Cluster", "children": []}
         self.rolling_indices = {}
         self.rolling_indices_size = {}
+        self.hotspots = {"nodes": {}, "rollingPatterns": {}}
         self.max_indices_per_node = 1000  # Limit the number of indices shown per node
         self.min_index_size_to_show = 1  # Minimum size in MB to show an index individually
 
     def process_data(self):
         logger.debug(f"Processing data. Raw data keys: {self.raw_data.keys()}")
+        self.hotspots = HotspotAnalyzer(self.raw_data).analyze()
         self._process_nodes()
         self._process_indices()
         return {
             "cluster_data": self.cluster_data,
             "rolling_indices": self.rolling_indices,
-            "rolling_indices_size": self.rolling_indices_size
+            "rolling_indices_size": self.rolling_indices_size,
+            "hotspots": self.hotspots
         }
 
     def _process_nodes(self):
@@ -32,7 +36,7 @@ class DataProcessor:
         for node_id, node_info in nodes_info.items():
             node_stats = nodes_stats.get(node_id, {})
             node_type = determine_node_type(node_info)
-            memory_usage = self._calculate_memory_usage(node_stats)
+            memory_usage = calculate_memory_usage(node_stats)
             node_data = {
                 "name": node_info.get('name', 'Unknown'),
                 "diskUsage": calculate_disk_usage(node_stats),
@@ -42,6 +46,7 @@ class DataProcessor:
                 "cpuUsage": node_stats.get('os', {}).get('cpu', {}).get('percent', 0),
                 "cpuFree": 100 - node_stats.get('os', {}).get('cpu', {}).get('percent', 0),
                 "memoryDetails": memory_usage,
+                "hotspot": self.hotspots["nodes"].get(node_id),
                 "children": self._get_node_indices(node_id)
             }
             node_types[node_type].append(node_data)
@@ -53,26 +58,6 @@ class DataProcessor:
                     "children": nodes
                 })
 
-    def _calculate_memory_usage(self, node_stats):
-        total = node_stats.get('os', {}).get('mem', {}).get('total_in_bytes', 0)
-        jvm_heap = node_stats.get('jvm', {}).get('mem', {}).get('heap_used_in_bytes', 0)
-        field_data_cache = node_stats.get('indices', {}).get('fielddata', {}).get('memory_size_in_bytes', 0)
-        query_cache = node_stats.get('indices', {}).get('query_cache', {}).get('memory_size_in_bytes', 0)
-        segment_memory = node_stats.get('indices', {}).get('segments', {}).get('memory_in_bytes', 0)
-        
-        used = jvm_heap + field_data_cache + query_cache + segment_memory
-        percentage = (used / total) * 100 if total > 0 else 0
-        
-        return {
-            "total": total,
-            "jvmHeap": jvm_heap,
-            "fieldDataCache": field_data_cache,
-            "queryCache": query_cache,
-            "segmentMemory": segment_memory,
-            "used": used,
-            "percentage": round(percentage, 2)
-        }
-
     def _get_node_indices(self, node_id):
         node_indices = []
         other_indices = {"name": "Other Indices", "size": 0, "count": 0}
@@ -109,9 +94,8 @@ class DataProcessor:
         return node_indices
 
     def _determine_rolling_index(self, index_name):
-        parts = index_name.split('-')
-        if len(parts) > 1 and parts[-1].isdigit():
-            rolling_index = '-'.join(parts[:-1])
+        rolling_index = extract_rolling_pattern(index_name)
+        if rolling_index:
             if rolling_index not in self.rolling_indices:
                 self.rolling_indices[rolling_index] = []
                 self.rolling_indices_size[rolling_index] = 0
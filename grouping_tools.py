@@ -5,8 +5,10 @@ import re
 import logging
 import os
 import csv
-from config import LOGGING_FORMAT, LOGGING_LEVEL, REQUIRED_FILES, VISUALIZATION_OUTPUT
+from config import LOGGING_FORMAT, LOGGING_LEVEL, REQUIRED_FILES, VISUALIZATION_OUTPUT, HOTSPOT_REPORT_LIMIT
 from jinja2 import Template
+from data.hotspots import HotspotAnalyzer, NODE_METRICS
+from utils.helpers import calculate_disk_usage, calculate_memory_usage
 
 # Set up logging
 logging.basicConfig(format=LOGGING_FORMAT, level=LOGGING_LEVEL)
@@ -40,26 +42,23 @@ def format_bytes(bytes_value):
             return f"{bytes_value:.2f} {unit}"
         bytes_value /= 1024.0
 
-def calculate_memory_usage(node_stats):
-    total = node_stats.get('os', {}).get('mem', {}).get('total_in_bytes', 0)
-    jvm_heap = node_stats.get('jvm', {}).get('mem', {}).get('heap_used_in_bytes', 0)
-    field_data_cache = node_stats.get('indices', {}).get('fielddata', {}).get('memory_size_in_bytes', 0)
-    query_cache = node_stats.get('indices', {}).get('query_cache', {}).get('memory_size_in_bytes', 0)
-    segment_memory = node_stats.get('indices', {}).get('segments', {}).get('memory_in_bytes', 0)
-    used = jvm_heap + field_data_cache + query_cache + segment_memory
-    percentage = (used / total) * 100 if total > 0 else 0
-    return {
-        "total": total,
-        "jvmHeap": jvm_heap,
-        "fieldDataCache": field_data_cache,
-        "queryCache": query_cache,
-        "segmentMemory": segment_memory,
-        "used": used,
-        "percentage": round(percentage, 2)
-    }
+def top_hotspots(entries):
+    return [(key, entry) for key, entry in entries.items() if entry['isHotspot']][:HOTSPOT_REPORT_LIMIT]
 
-def group_nodes(node_stats, node_info):
+def format_hot_metrics(hotspot):
+    return ', '.join(
+        f"{NODE_METRICS[metric]} (z={hotspot['metrics'][metric]['zscore']:.2f}, p{hotspot['metrics'][metric]['percentile']:.0f})"
+        for metric in hotspot['hotMetrics']
+    )
+
+def format_hotspot_score(hotspot):
+    if not hotspot:
+        return ''
+    return f"{hotspot['score']:.2f}" if hotspot['scored'] else 'n/a (tier too small)'
+
+def group_nodes(node_stats, node_info, hotspots=None):
     groups = defaultdict(list)
+    node_hotspots = hotspots['nodes'] if hotspots else {}
     
     for node_id, stats in node_stats['nodes'].items():
         info = node_info['nodes'].get(node_id, {})
@@ -75,7 +74,7 @@ def group_nodes(node_stats, node_info):
         
         total_disk = stats['fs']['total']['total_in_bytes']
         used_disk = total_disk - stats['fs']['total']['available_in_bytes']
-        disk_usage = (used_disk / total_disk) * 100
+        disk_usage = calculate_disk_usage(stats)
         
         heap_used = stats['jvm']['mem']['heap_used_in_bytes']
         heap_max = stats['jvm']['mem']['heap_max_in_bytes']
@@ -92,7 +91,8 @@ def group_nodes(node_stats, node_info):
             'disk_used': used_disk,
             'total_disk': total_disk,
             'heap_used': heap_used,
-            'heap_max': heap_max
+            'heap_max': heap_max,
+            'hotspot': node_hotspots.get(node_id)
         })
     
     # Calculate group summaries
@@ -103,6 +103,7 @@ def group_nodes(node_stats, node_info):
         total_disk = sum(node['total_disk'] for node in nodes)
         total_cpu_usage = sum(node['cpu_usage'] for node in nodes)
         node_count = len(nodes)
+        hotspot_count = sum(1 for node in nodes if node['hotspot'] and node['hotspot']['isHotspot'])
         
         groups[group_name] = {
             'nodes': nodes,
@@ -111,13 +112,14 @@ def group_nodes(node_stats, node_info):
                 'avg_total_memory': total_memory / node_count,
                 'avg_disk_used': total_disk_used / node_count,
                 'avg_total_disk': total_disk / node_count,
-                'avg_cpu_usage': total_cpu_usage / node_count
+                'avg_cpu_usage': total_cpu_usage / node_count,
+                'hotspot_count': hotspot_count
             }
         }
     
     return groups
 
-def generate_html_report(groups):
+def generate_html_report(groups, hotspots):
     html_template = """
     <!DOCTYPE html>
     <html lang="en">
@@ -131,15 +133,68 @@ def generate_html_report(groups):
             th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
             th { background-color: #f2f2f2; }
             .summary { background-color: #e6f3ff; font-weight: bold; }
+            .hotspot { background-color: #fde0dd; }
         </style>
     </head>
     <body>
         <h1>ElasticSearch Cluster Report</h1>
+        <h2>Hot Spot Nodes</h2>
+        <table>
+            <tr>
+                <th>Rank</th>
+                <th>Hostname</th>
+                <th>Tier</th>
+                <th>Score</th>
+                <th>Hot Metrics</th>
+            </tr>
+            {% for node_id, hotspot in top_hotspots(hotspots.nodes) %}
+            <tr class="hotspot">
+                <td>{{ hotspot.rank }}</td>
+                <td>{{ hotspot.name }}</td>
+                <td>{{ hotspot.tier }}</td>
+                <td>{{ '%.2f'|format(hotspot.score) }}</td>
+                <td>{{ format_hot_metrics(hotspot) }}</td>
+            </tr>
+            {% else %}
+            <tr><td colspan="5">No hot spot nodes detected</td></tr>
+            {% endfor %}
+        </table>
+        <h2>Hot Spot Rolling Patterns</h2>
+        <table>
+            <tr>
+                <th>Rank</th>
+                <th>Pattern</th>
+                <th>Tier</th>
+                <th>Score</th>
+                <th>Shards</th>
+                <th>Nodes</th>
+                <th>Busiest Node</th>
+                <th>Busiest Node Shards</th>
+                <th>Expected Max Shards</th>
+                <th>Shards on Hot Spot Nodes</th>
+            </tr>
+            {% for pattern, hotspot in top_hotspots(hotspots.rollingPatterns) %}
+            <tr class="hotspot">
+                <td>{{ hotspot.rank }}</td>
+                <td>{{ pattern }}</td>
+                <td>{{ hotspot.tier }}</td>
+                <td>{{ '%.2f'|format(hotspot.score) }}</td>
+                <td>{{ hotspot.shardCount }}</td>
+                <td>{{ hotspot.nodeCount }}</td>
+                <td>{{ hotspot.maxNode }}</td>
+                <td>{{ hotspot.maxNodeShards }}</td>
+                <td>{{ hotspot.expectedShards }}</td>
+                <td>{{ hotspot.hotspotShards }}</td>
+            </tr>
+            {% else %}
+            <tr><td colspan="10">No hot spot rolling patterns detected</td></tr>
+            {% endfor %}
+        </table>
         {% for group_name, group_data in groups.items() %}
             <h2>Group: {{ group_name }}</h2>
             <table>
                 <tr class="summary">
-                    <td colspan="16">Group Summary</td>
+                    <td colspan="17">Group Summary</td>
                 </tr>
                 <tr class="summary">
                     <td>Avg Memory Used</td>
@@ -147,6 +202,7 @@ def generate_html_report(groups):
                     <td>Avg Disk Used</td>
                     <td>Avg Total Disk</td>
                     <td>Avg CPU Usage</td>
+                    <td>Hot Spots</td>
                 </tr>
                 <tr class="summary">
                     <td>{{ format_bytes(group_data.summary.avg_memory_used) }}</td>
@@ -154,6 +210,7 @@ def generate_html_report(groups):
                     <td>{{ format_bytes(group_data.summary.avg_disk_used) }}</td>
                     <td>{{ format_bytes(group_data.summary.avg_total_disk) }}</td>
                     <td>{{ '%.2f'|format(group_data.summary.avg_cpu_usage) }}%</td>
+                    <td>{{ group_data.summary.hotspot_count }}</td>
                 </tr>
                 <tr>
                     <th>Hostname</th>
@@ -172,9 +229,10 @@ def generate_html_report(groups):
                     <th>Total Disk</th>
                     <th>Heap Used</th>
                     <th>Max Heap</th>
+                    <th>Hot Spot Score</th>
                 </tr>
                 {% for node in group_data.nodes %}
-                <tr>
+                <tr{% if node.hotspot and node.hotspot.isHotspot %} class="hotspot"{% endif %}>
                     <td>{{ node.hostname }}</td>
                     <td>{{ node.ip }}</td>
                     <td>{{ ', '.join(node.roles) }}</td>
@@ -191,6 +249,7 @@ def generate_html_report(groups):
                     <td>{{ format_bytes(node.total_disk) }}</td>
                     <td>{{ format_bytes(node.heap_used) }}</td>
                     <td>{{ format_bytes(node.heap_max) }}</td>
+                    <td>{{ format_hotspot_score(node.hotspot) }}</td>
                 </tr>
                 {% endfor %}
             </table>
@@ -199,25 +258,43 @@ def generate_html_report(groups):
     </html>
     """
     template = Template(html_template)
-    return template.render(groups=groups, format_bytes=format_bytes)
+    return template.render(groups=groups, hotspots=hotspots, format_bytes=format_bytes,
+                           top_hotspots=top_hotspots, format_hot_metrics=format_hot_metrics,
+                           format_hotspot_score=format_hotspot_score)
 
-def generate_csv_report(groups):
+def generate_csv_report(groups, hotspots):
     csv_data = []
+    csv_data.append(['Hot Spot Nodes'])
+    csv_data.append(['Rank', 'Hostname', 'Tier', 'Score', 'Hot Metrics'])
+    for node_id, hotspot in top_hotspots(hotspots['nodes']):
+        csv_data.append([hotspot['rank'], hotspot['name'], hotspot['tier'], f"{hotspot['score']:.2f}",
+                         format_hot_metrics(hotspot)])
+    csv_data.append([])  # Empty row for separation
+    csv_data.append(['Hot Spot Rolling Patterns'])
+    csv_data.append(['Rank', 'Pattern', 'Tier', 'Score', 'Shards', 'Nodes', 'Busiest Node',
+                     'Busiest Node Shards', 'Expected Max Shards', 'Shards on Hot Spot Nodes'])
+    for pattern, hotspot in top_hotspots(hotspots['rollingPatterns']):
+        csv_data.append([hotspot['rank'], pattern, hotspot['tier'], f"{hotspot['score']:.2f}",
+                         hotspot['shardCount'], hotspot['nodeCount'], hotspot['maxNode'],
+                         hotspot['maxNodeShards'], hotspot['expectedShards'], hotspot['hotspotShards']])
+    csv_data.append([])  # Empty row for separation
     for group_name, group_data in groups.items():
         csv_data.append(['Group', group_name])
-        csv_data.append(['Avg Memory Used', 'Avg Total Memory', 'Avg Disk Used', 'Avg Total Disk', 'Avg CPU Usage'])
+        csv_data.append(['Avg Memory Used', 'Avg Total Memory', 'Avg Disk Used', 'Avg Total Disk', 'Avg CPU Usage',
+                         'Hot Spots'])
         csv_data.append([
             format_bytes(group_data['summary']['avg_memory_used']),
             format_bytes(group_data['summary']['avg_total_memory']),
             format_bytes(group_data['summary']['avg_disk_used']),
             format_bytes(group_data['summary']['avg_total_disk']),
-            f"{group_data['summary']['avg_cpu_usage']:.2f}%"
+            f"{group_data['summary']['avg_cpu_usage']:.2f}%",
+            group_data['summary']['hotspot_count']
         ])
         csv_data.append([])  # Empty row for separation
         csv_data.append(['Hostname', 'IP', 'Roles', 'CPU Usage (%)', 'Memory Usage (%)', 
                          'Memory Used', 'Total Memory', 'JVM Heap', 'Field Data Cache', 'Query Cache',
                          'Segment Memory', 'Disk Usage (%)', 'Disk Used', 'Total Disk', 
-                         'Heap Used', 'Max Heap'])
+                         'Heap Used', 'Max Heap', 'Hot Spot Score'])
         for node in group_data['nodes']:
             csv_data.append([
                 node['hostname'],
@@ -235,7 +312,8 @@ def generate_csv_report(groups):
                 format_bytes(node['disk_used']),
                 format_bytes(node['total_disk']),
                 format_bytes(node['heap_used']),
-                format_bytes(node['heap_max'])
+                format_bytes(node['heap_max']),
+                format_hotspot_score(node['hotspot'])
             ])
         csv_data.append([])  # Empty row for separation
     return csv_data
@@ -253,16 +331,21 @@ def main():
         logger.error("Failed to load one or more required files")
         return
 
-    groups = group_nodes(node_stats, node_info)
+    hotspots = HotspotAnalyzer({
+        'nodes_stats.json': node_stats,
+        'nodes.json': node_info,
+        'indices_stats.json': indices_stats
+    }).analyze()
+    groups = group_nodes(node_stats, node_info, hotspots)
 
     # Generate HTML report
-    html_report = generate_html_report(groups)
+    html_report = generate_html_report(groups, hotspots)
     with open(VISUALIZATION_OUTPUT, 'w') as f:
         f.write(html_report)
     logger.info(f"HTML report saved to: {VISUALIZATION_OUTPUT}")
 
     # Generate CSV report
-    csv_data = generate_csv_report(groups)
+    csv_data = generate_csv_report(groups, hotspots)
     csv_output = os.path.splitext(VISUALIZATION_OUTPUT)[0] + '.csv'
     with open(csv_output, 'w', newline='') as f:
         writer = csv.writer(f)
@@ -279,6 +362,7 @@ def main():
         logger.info(f"    Avg Disk Used: {format_bytes(group_data['summary']['avg_disk_used'])}")
         logger.info(f"    Avg Total Disk: {format_bytes(group_data['summary']['avg_total_disk'])}")
         logger.info(f"    Avg CPU Usage: {group_data['summary']['avg_cpu_usage']:.2f}%")
+        logger.info(f"    Hot Spots: {group_data['summary']['hotspot_count']}")
         for node in group_data['nodes']:
             logger.info(f"  - Hostname: {node['hostname']}")
             logger.info(f"    IP: {node['ip']}")
@@ -296,6 +380,8 @@ def main():
             logger.info(f"    Total Disk: {format_bytes(node['total_disk'])}")
             logger.info(f"    Heap Used: {format_bytes(node['heap_used'])}")
             logger.info(f"    Max Heap: {format_bytes(node['heap_max'])}")
+            if node['hotspot'] and node['hotspot']['isHotspot']:
+                logger.info(f"    Hot Spot: #{node['hotspot']['rank']} {format_hot_metrics(node['hotspot'])}")
 
 if __name__ == "__main__":
     main()
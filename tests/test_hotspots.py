@@ -0,0 +1,198 @@
+import random
+import pytest
+from data.hotspots import HotspotAnalyzer
+
+
+def make_raw_data(nodes, indices=None):
+    """Build loader-shaped raw data from {node_id: (role, {metric overrides})}."""
+    nodes_info = {}
+    nodes_stats = {}
+    for node_id, (role, metrics) in nodes.items():
+        nodes_info[node_id] = {"name": f"es-{node_id}", "roles": [role]}
+        nodes_stats[node_id] = {
+            "os": {"cpu": {"percent": metrics.get("cpu", 20)}},
+            "jvm": {"mem": {"heap_used_in_bytes": metrics.get("heap_used", 10), "heap_max_in_bytes": 100}},
+            "fs": {"total": {"total_in_bytes": 100, "available_in_bytes": 50}}
+        }
+    return {
+        "nodes_stats.json": {"nodes": nodes_stats},
+        "nodes.json": {"nodes": nodes_info},
+        "indices_stats.json": {"indices": indices or {}}
+    }
+
+
+def make_index(*node_ids):
+    """One primary shard per node id, in order."""
+    return {"shards": {str(i): [{"routing": {"node": node_id}}] for i, node_id in enumerate(node_ids)}}
+
+
+def test_single_outlier_is_flagged_in_three_node_tier():
+    raw_data = make_raw_data({
+        "a": ("data_hot", {"cpu": 99}),
+        "b": ("data_hot", {"cpu": 1}),
+        "c": ("data_hot", {"cpu": 1})
+    })
+
+    result = HotspotAnalyzer(raw_data).analyze()["nodes"]
+
+    assert result["a"]["isHotspot"]
+    assert result["a"]["rank"] == 1
+    assert result["a"]["hotMetrics"] == ["cpu"]
+    assert not result["b"]["isHotspot"]
+    assert not result["c"]["isHotspot"]
+
+
+def test_tier_below_minimum_size_is_unscored():
+    raw_data = make_raw_data({
+        "a": ("data_warm", {"cpu": 99}),
+        "b": ("data_warm", {"cpu": 1}),
+        "c": ("data_hot", {}),
+        "d": ("data_hot", {}),
+        "e": ("data_hot", {})
+    })
+
+    result = HotspotAnalyzer(raw_data).analyze()["nodes"]
+
+    for node_id in ("a", "b"):
+        assert result[node_id]["scored"] is False
+        assert result[node_id]["score"] is None
+        assert result[node_id]["rank"] is None
+        assert result[node_id]["hotMetrics"] == []
+    assert result["c"]["scored"] is True
+    assert list(result)[-2:] == ["a", "b"]  # unscored nodes rank after scored ones
+
+
+def test_near_uniform_tier_has_no_hotspots():
+    nodes = {f"n{i}": ("data_hot", {"cpu": 20}) for i in range(10)}
+    nodes["n10"] = ("data_hot", {"cpu": 21, "heap_used": 11})
+    # 100 shards on every node except one with 101
+    indices = {f"idx{i}": make_index(*nodes) for i in range(100)}
+    indices["extra"] = make_index("n10")
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()["nodes"]
+
+    assert result["n10"]["metrics"]["shardCount"]["value"] == 101
+    assert not any(node["isHotspot"] for node in result.values())
+    assert all(node["hotMetrics"] == [] for node in result.values())
+
+
+def test_identical_tier_scores_zero():
+    nodes = {f"n{i}": ("data_cold", {}) for i in range(5)}
+
+    result = HotspotAnalyzer(make_raw_data(nodes)).analyze()["nodes"]
+
+    assert all(node["score"] == 0 for node in result.values())
+    assert all(node["metrics"]["cpu"]["zscore"] == 0 for node in result.values())
+
+
+def test_pattern_score_is_excess_over_random_placement_maximum():
+    nodes = {node_id: ("data_hot", {}) for node_id in ("a", "b", "c")}
+    # 30 shards over 3 nodes: mean 10, random placement keeps the busiest node at or below 20
+    indices = {f"logs-{day:06d}": make_index("a", "a", "a") for day in range(10)}
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()["rollingPatterns"]
+
+    pattern = result["logs"]
+    assert pattern["expectedShards"] == 20
+    assert pattern["maxNode"] == "es-a"
+    assert pattern["maxNodeShards"] == 30
+    assert pattern["nodeCount"] == 1
+    assert pattern["score"] == pytest.approx((30 - 20) / 5)
+    assert pattern["isHotspot"]
+
+
+def test_small_pattern_concentration_stays_below_minimum_excess():
+    nodes = {node_id: ("data_hot", {}) for node_id in ("a", "b", "c")}
+    indices = {"logs-000001": make_index("a", "a", "a"), "logs-000002": make_index("a", "a", "a")}
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()["rollingPatterns"]
+
+    assert result["logs"]["maxNodeShards"] == 6
+    assert not result["logs"]["isHotspot"]
+
+
+def test_cross_tier_pattern_reports_worst_tier():
+    nodes = {node_id: ("data_hot", {}) for node_id in ("h1", "h2", "h3")}
+    nodes.update({node_id: ("data_warm", {}) for node_id in ("w1", "w2", "w3")})
+    # Evenly spread in the hot tier, piled on one node in the warm tier
+    indices = {"logs-000001": make_index("h1", "h2", "h3")}
+    indices.update({f"logs-{day:06d}": make_index("w1", "w1", "w1") for day in range(2, 12)})
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()["rollingPatterns"]
+
+    assert list(result) == ["logs"]
+    assert result["logs"]["tier"] == "warm"
+    assert result["logs"]["maxNode"] == "es-w1"
+    assert result["logs"]["shardCount"] == 30
+    assert result["logs"]["isHotspot"]
+
+
+def test_pattern_in_tier_below_minimum_size_is_unscored():
+    nodes = {node_id: ("data_warm", {}) for node_id in ("w1", "w2")}
+    indices = {f"logs-{day:06d}": make_index("w1", "w1") for day in range(4)}
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()["rollingPatterns"]
+
+    assert result["logs"]["scored"] is False
+    assert result["logs"]["score"] is None
+    assert result["logs"]["rank"] is None
+    assert not result["logs"]["isHotspot"]
+
+
+@pytest.mark.parametrize("tier_size", [10, 30, 100])
+def test_balanced_allocation_of_many_patterns_is_not_flagged(tier_size):
+    # 30 patterns x 30 daily indices, one primary and one replica each, rolled over in
+    # interleaved order onto whichever nodes hold the fewest shards
+    rng = random.Random(tier_size)
+    node_ids = [f"n{i}" for i in range(tier_size)]
+    totals = dict.fromkeys(node_ids, 0)
+    indices = {}
+    for day in range(30):
+        for pattern in range(30):
+            least_loaded = sorted(node_ids, key=lambda node_id: (totals[node_id], rng.random()))[:2]
+            for node_id in least_loaded:
+                totals[node_id] += 1
+            indices[f"pattern{pattern}-{day:06d}"] = make_index(*least_loaded)
+    nodes = {node_id: ("data_hot", {}) for node_id in node_ids}
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()
+
+    assert len(result["rollingPatterns"]) == 30
+    assert not any(pattern["isHotspot"] for pattern in result["rollingPatterns"].values())
+    assert not any(node["isHotspot"] for node in result["nodes"].values())
+
+
+def test_balanced_patterns_are_not_hotspots_and_plain_indices_are_ignored():
+    nodes = {node_id: ("data_hot", {}) for node_id in ("a", "b", "c")}
+    indices = {
+        "logs-000001": make_index("a", "b", "c"),
+        "metrics-000001": make_index("a", "b", "c"),
+        "plain": make_index("a", "a", "a"),
+        "unassigned-000001": {"shards": {"0": [{"routing": {"node": None}}]}}
+    }
+
+    result = HotspotAnalyzer(make_raw_data(nodes, indices)).analyze()
+
+    assert set(result["rollingPatterns"]) == {"logs", "metrics"}
+    assert not any(pattern["isHotspot"] for pattern in result["rollingPatterns"].values())
+    assert result["nodes"]["a"]["metrics"]["shardCount"]["value"] == 5
+
+
+def test_no_indices():
+    nodes = {node_id: ("data_hot", {}) for node_id in ("a", "b", "c")}
+
+    result = HotspotAnalyzer(make_raw_data(nodes)).analyze()
+
+    assert result["rollingPatterns"] == {}
+    assert all(node["metrics"]["shardCount"]["value"] == 0 for node in result["nodes"].values())
+
+
+def test_no_nodes_skips_shard_table(monkeypatch):
+    raw_data = make_raw_data({}, {"logs-000001": make_index("a")})
+    analyzer = HotspotAnalyzer(raw_data)
+
+    def fail(nodes):
+        raise AssertionError("shard table built without nodes")
+    monkeypatch.setattr(analyzer, "_build_shard_table", fail)
+
+    assert analyzer.analyze() == {"nodes": {}, "rollingPatterns": {}}
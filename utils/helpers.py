@@ -1,14 +1,27 @@
 def calculate_memory_usage(node_stats):
-    """Calculate memory usage percentage for a node."""
-    total_memory = node_stats.get('os', {}).get('mem', {}).get('total_in_bytes', 0)
-    used_memory = node_stats.get('os', {}).get('mem', {}).get('used_in_bytes', 0)
-    return round((used_memory / total_memory) * 100 if total_memory else 0, 2)
+    """Break down the Elasticsearch memory use of a node against its total memory."""
+    total = node_stats.get('os', {}).get('mem', {}).get('total_in_bytes', 0)
+    jvm_heap = node_stats.get('jvm', {}).get('mem', {}).get('heap_used_in_bytes', 0)
+    field_data_cache = node_stats.get('indices', {}).get('fielddata', {}).get('memory_size_in_bytes', 0)
+    query_cache = node_stats.get('indices', {}).get('query_cache', {}).get('memory_size_in_bytes', 0)
+    segment_memory = node_stats.get('indices', {}).get('segments', {}).get('memory_in_bytes', 0)
+    used = jvm_heap + field_data_cache + query_cache + segment_memory
+    percentage = (used / total) * 100 if total > 0 else 0
+    return {
+        "total": total,
+        "jvmHeap": jvm_heap,
+        "fieldDataCache": field_data_cache,
+        "queryCache": query_cache,
+        "segmentMemory": segment_memory,
+        "used": used,
+        "percentage": round(percentage, 2)
+    }
 
 def calculate_disk_usage(node_stats):
-    """Calculate disk usage percentage for a node."""
+    """Calculate disk usage percentage for a node, counting space unavailable to Elasticsearch as used."""
     total_disk = node_stats.get('fs', {}).get('total', {}).get('total_in_bytes', 0)
-    free_disk = node_stats.get('fs', {}).get('total', {}).get('free_in_bytes', 0)
-    return round((total_disk - free_disk)/total_disk * 100 if total_disk else 0, 2)
+    available_disk = node_stats.get('fs', {}).get('total', {}).get('available_in_bytes', 0)
+    return round((total_disk - available_disk)/total_disk * 100 if total_disk else 0, 2)
 
 def determine_node_type(node_info):
     """Determine the type of a node based on its roles or settings."""
@@ -25,3 +38,10 @@ def determine_node_type(node_info):
         return 'frozen'
     else:
         return 'hot'  # Default to hot if unable to determine
+
+def extract_rolling_pattern(index_name):
+    """Return the rolling pattern of an index (name without its numeric suffix), or None."""
+    parts = index_name.split('-')
+    if len(parts) > 1 and parts[-1].isdigit():
+        return '-'.join(parts[:-1])
+    return None
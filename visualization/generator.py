@@ -10,6 +10,7 @@ class VisualizationGenerator:
         self.cluster_data = processed_data.get('cluster_data', {})
         self.rolling_indices = processed_data.get('rolling_indices', {})
         self.rolling_indices_size = processed_data.get('rolling_indices_size', {})
+        self.hotspots = processed_data.get('hotspots', {"nodes": {}, "rollingPatterns": {}})
         self.all_indices = self._get_all_indices()
 
     def _get_all_indices(self):
@@ -37,11 +38,13 @@ class VisualizationGenerator:
             rolling_indices_json = json.dumps(self.rolling_indices, indent=2)
             rolling_indices_size_json = json.dumps(self.rolling_indices_size, indent=2)
             all_indices_json = json.dumps(self.all_indices, indent=2)
+            hotspots_json = json.dumps(self.hotspots, indent=2)
 
             logger.debug(f"Cluster data size: {len(cluster_data_json)} characters")
             logger.debug(f"Rolling indices data size: {len(rolling_indices_json)} characters")
             logger.debug(f"Rolling indices size data size: {len(rolling_indices_size_json)} characters")
             logger.debug(f"All indices data size: {len(all_indices_json)} characters")
+            logger.debug(f"Hotspots data size: {len(hotspots_json)} characters")
 
             # Replace placeholders in the template
             visualization = template.replace(
@@ -52,6 +55,8 @@ class VisualizationGenerator:
                 '{{ ROLLING_INDICES_SIZE }}', rolling_indices_size_json
             ).replace(
                 '{{ ALL_INDICES }}', all_indices_json
+            ).replace(
+                '{{ HOTSPOTS }}', hotspots_json
             )
 
             logger.debug(f"Placeholders replaced, new visualization size: {len(visualization)} characters")
@@ -96,5 +101,8 @@ class VisualizationGenerator:
         if not isinstance(self.rolling_indices_size, dict):
             logger.error("Invalid rolling indices size data structure")
             return False
+        if not isinstance(self.hotspots, dict):
+            logger.error("Invalid hotspots data structure")
+            return False
         return True
 
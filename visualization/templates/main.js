@@ -76,7 +76,9 @@ filterType.on("change", function() {
         filterValue.property("disabled", false);
         if (selectedType === "rolling") {
             Object.keys(rollingIndices).forEach(pattern => {
-                filterValue.append("option").attr("value", pattern).text(pattern);
+                const hotspot = hotspots.rollingPatterns[pattern];
+                const label = hotspot && hotspot.isHotspot ? `${pattern} (hot spot #${hotspot.rank})` : pattern;
+                filterValue.append("option").attr("value", pattern).text(label);
             });
         } else if (selectedType === "index") {
             allIndices.forEach(index => {
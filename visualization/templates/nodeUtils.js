@@ -19,3 +19,9 @@ function addNodeTypeCount(node) {
         .attr("class", "node-type-count")
         .text(d => `(${d.children ? d.children.length : 0})`);
 }
+
+function isHotspot(d) {
+    if (d.data.hotspot) return d.data.hotspot.isHotspot;
+    const pattern = d.data.rollingIndex && hotspots.rollingPatterns[d.data.rollingIndex];
+    return Boolean(pattern && pattern.isHotspot);
+}
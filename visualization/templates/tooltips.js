@@ -34,9 +34,16 @@ function generateTooltipContent(d) {
         content += addMemoryDetailsToTooltip(d.data.memoryDetails);
     }
 
+    if (d.data.hotspot) {
+        content += addNodeHotspotToTooltip(d.data.hotspot);
+    }
+
     if (d.data.rollingIndex) {
         content += `Rolling Index: ${d.data.rollingIndex}<br/>`;
         content += `Total Size: ${rollingIndicesSize[d.data.rollingIndex]} MB<br/>`;
+        if (hotspots.rollingPatterns[d.data.rollingIndex]) {
+            content += addPatternHotspotToTooltip(hotspots.rollingPatterns[d.data.rollingIndex]);
+        }
     }
 
     return content;
@@ -48,3 +55,32 @@ function addMemoryDetailsToTooltip(memDetails) {
            `Query Cache: ${(memDetails.queryCache / (1024 * 1024)).toFixed(2)} MB<br/>` +
            `Segment Memory: ${(memDetails.segmentMemory / (1024 * 1024)).toFixed(2)} MB<br/>`;
 }
+
+const hotspotMetricLabels = {
+    cpu: "CPU",
+    heap: "Heap",
+    disk: "Disk",
+    fieldDataCache: "Field Data Cache",
+    queryCache: "Query Cache",
+    segmentMemory: "Segment Memory",
+    shardCount: "Shard Count"
+};
+
+function addNodeHotspotToTooltip(hotspot) {
+    if (!hotspot.scored) {
+        return `Hot Spot: not scored (${hotspot.tier} tier too small)<br/>`;
+    }
+    if (!hotspot.isHotspot) return "";
+    let content = `<span class="tooltip-hotspot">Hot Spot Rank: #${hotspot.rank} (score ${hotspot.score})</span><br/>`;
+    hotspot.hotMetrics.forEach(metric => {
+        const stats = hotspot.metrics[metric];
+        content += `&nbsp;&nbsp;${hotspotMetricLabels[metric]}: z=${stats.zscore}, p${stats.percentile} in ${hotspot.tier} tier<br/>`;
+    });
+    return content;
+}
+
+function addPatternHotspotToTooltip(pattern) {
+    if (!pattern.isHotspot) return "";
+    return `<span class="tooltip-hotspot">Pattern Hot Spot Rank: #${pattern.rank} (score ${pattern.score})</span><br/>` +
+           `Busiest Node: ${pattern.maxNode} (${pattern.maxNodeShards} shards, expected at most ${pattern.expectedShards})<br/>`;
+}
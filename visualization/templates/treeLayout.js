@@ -34,6 +34,7 @@ function createTreeLayout(root, g, width, height, nodeSpacing) {
     // Add circles to nodes
     node.append("circle")
         .attr("r", 10)
+        .classed("hotspot", isHotspot)
         .style("fill", getNodeColor);
 
     // Add labels to nodes